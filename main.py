@@ -10,10 +10,29 @@ compiles everything into a narrative report in Markdown format.
 
 import os
 import argparse
+import pathlib
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
+
+# Upper bound on the number of points drawn in the scatter plot
+MAX_SCATTER_POINTS = 20000
+
+# Upper bound on the number of anomalous rows tabulated in the report
+MAX_REPORTED_ANOMALIES = 100
+
+# Largest magnitude analyzed in float32 before falling back to float64
+FLOAT32_MAX_MAGNITUDE = 1e6
+
+# PNG output settings; the fastest zlib level trades a slightly larger file
+# for much quicker saves (the image is identical), and 96 dpi is plenty for
+# a Markdown report
+PNG_SAVE_OPTIONS = {
+    'dpi': 96,
+    'pil_kwargs': {'compress_level': 1, 'optimize': False}
+}
 
 def load_data(file_path):
     """
@@ -29,72 +48,521 @@ def load_data(file_path):
         raise FileNotFoundError(f"Error: The file '{file_path}' was not found.")
 
     print(f"Loading data from '{file_path}'...")
-    return pd.read_csv(file_path)
+    # Parse with Arrow's multithreaded reader through pandas, which applies
+    # the same missing-value tokens as its own parser and returns NumPy-backed
+    # columns. Arrow rejects ragged rows, keeps duplicate headers as they
+    # are and types the columns of a header-only file as float, so those
+    # files go through the default parser, which pads missing fields with
+    # NaN, renames repeated columns (a, a.1) and keeps empty columns as text,
+    # exactly as --chunksize reads them
+    try:
+        df = pd.read_csv(file_path, engine='pyarrow')
+    except pd.errors.ParserError:
+        return pd.read_csv(file_path)
+    if df.empty or df.columns.duplicated().any():
+        return pd.read_csv(file_path)
+    return df
+
+def load_and_stream(file_path, chunksize=10**6, usecols=None):
+    """
+    Reads a CSV file lazily, one chunk of rows at a time.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        chunksize (int): The maximum number of rows per chunk.
+        usecols (list): Positions of the columns to read, or None for all.
+
+    Yields:
+        pandas.DataFrame: Consecutive chunks of the data.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Error: The file '{file_path}' was not found.")
+
+    with pd.read_csv(file_path, chunksize=chunksize, usecols=usecols) as reader:
+        yield from reader
+
+def _to_float_matrix(frame):
+    """
+    Converts numerical columns to a column-major floating point matrix.
+
+    The analysis is memory-bound, so float32 is used to halve the bytes moved
+    per value. Data with magnitudes beyond FLOAT32_MAX_MAGNITUDE is kept in
+    float64 instead, where float32 would no longer resolve small differences.
+
+    Args:
+        frame (pandas.DataFrame): Numerical columns only.
+
+    Returns:
+        numpy.ndarray: 2D array of the values, one column per variable.
+    """
+    X = np.asfortranarray(frame.to_numpy(dtype=np.float32))
+    largest = max(np.nanmax(X, initial=-np.inf), -np.nanmin(X, initial=np.inf))
+    if largest > FLOAT32_MAX_MAGNITUDE:
+        X = np.asfortranarray(frame.to_numpy(dtype=np.float64))
+    return X
+
+def _iqr_column(col, mask, box):
+    """
+    Computes the box plot statistics of a 1D array and flags values outside 1.5 * IQR.
+
+    The quartiles and median are selected with ``np.partition`` in O(n) and
+    linearly interpolated, matching ``pandas.Series.quantile``. The whiskers
+    are the most extreme values that are not outliers. Missing values are
+    ignored when computing the statistics and are never flagged.
+
+    Args:
+        col (numpy.ndarray): The values to analyze.
+        mask (numpy.ndarray): Boolean output array, set where a value is an outlier.
+        box (numpy.ndarray): Output array of length 5 for the first quartile,
+            median, third quartile and the lower and upper whiskers.
+    """
+    # np.partition copies its input, so only filter when there is something
+    # to drop
+    missing = np.isnan(col)
+    values = col[~missing] if missing.any() else col
+    m = values.size
+    if m == 0:
+        box[:] = np.nan
+        return
+
+    pos = np.array([0.25, 0.5, 0.75]) * (m - 1)
+    lo = pos.astype(np.intp)
+    hi = np.minimum(lo + 1, m - 1)
+    part = np.partition(values, np.concatenate([lo, hi]))
+    # Interpolate in float64 so that float32 data gets the same quartiles,
+    # and keep the bounds float64 so the comparisons below are made in it too
+    a = part[lo].astype(np.float64)
+    b = part[hi].astype(np.float64)
+    Q1, median, Q3 = a + (b - a) * (pos - lo)
+    IQR = Q3 - Q1
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = Q3 + 1.5 * IQR
+
+    np.logical_or(col < lower_bound, col > upper_bound, out=mask)
+    inliers = col[~(mask | missing)]
+    # As in matplotlib, the whiskers never end inside the box, which can
+    # happen when interpolated quartiles fall between widely spaced values
+    whislo = min(inliers.min(initial=np.inf), Q1)
+    whishi = max(inliers.max(initial=-np.inf), Q3)
+
+    box[:] = Q1, median, Q3, whislo, whishi
+
+def _iqr_outliers(X):
+    """
+    Computes box plot statistics and IQR outlier masks for every column of a 2D array.
+
+    Args:
+        X (numpy.ndarray): 2D array of numerical values, one column per variable.
+
+    Returns:
+        tuple: A (5, k) array holding, per column, the first quartile, median,
+        third quartile and lower and upper whiskers, and a (k, n) boolean
+        mask of the outlying values of each column.
+    """
+    n, k = X.shape
+    box = np.empty((5, k))
+    masks = np.zeros((k, n), dtype=np.bool_)
+    # Infinite values make the interpolation produce NaN without a warning,
+    # as pandas does
+    with np.errstate(invalid='ignore'):
+        for j in range(k):
+            _iqr_column(X[:, j], masks[j], box[:, j])
+    return box, masks
+
+def compute_stats(num):
+    """
+    Computes all summary statistics needed by the report in one sweep.
+
+    Means come from a single column-sum reduction, and the centered
+    cross-product matrix ``X.T @ X`` from one BLAS call; standard deviations
+    and the Pearson correlation matrix are both derived from it. Quartiles,
+    box plot whiskers and IQR outlier masks are computed per column with
+    vectorized NumPy selections and comparisons.
+    Matrices containing missing or infinite values fall back to pandas for
+    the correlation, which treats both as missing and uses pairwise-complete
+    observations.
+
+    Args:
+        num (numpy.ndarray): 2D array of numerical values, one column per variable.
+
+    Returns:
+        dict: The correlation matrix ('corr'), column means ('mean'), standard
+        deviations ('std'), quartiles and median ('q1', 'median', 'q3'), box
+        plot whiskers ('whislo', 'whishi') and a (k, n) boolean array of
+        outlier masks ('masks').
+    """
+    print("Computing summary statistics...")
+    n = num.shape[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if not np.isfinite(num).all():
+            # pandas skips missing values like np.nanmean, but does not warn
+            # about columns that are entirely empty
+            frame = pd.DataFrame(num)
+            mean = frame.mean().to_numpy()
+            std = frame.std(ddof=0).to_numpy()
+            corr = frame.corr().to_numpy()
+        else:
+            mean = num.sum(axis=0, dtype=np.float64) / n
+            X = np.subtract(num, mean.astype(num.dtype), order='C')
+            G = X.T @ X
+            std = np.sqrt(np.diag(G) / n)
+            # Constant columns have zero spread and yield NaN, as in pandas
+            corr = G / (n * np.outer(std, std))
+
+    box, masks = _iqr_outliers(num)
+
+    return {
+        'corr': corr,
+        'mean': mean,
+        'std': std,
+        'q1': box[0],
+        'median': box[1],
+        'q3': box[2],
+        'whislo': box[3],
+        'whishi': box[4],
+        'masks': masks
+    }
+
+def compute_stats_streaming(file_path, chunksize):
+    """
+    Computes the summary statistics of a CSV file without loading it whole.
+
+    Like ``pandas.DataFrame.corr``, each correlation uses the rows where both
+    of its columns hold a finite value. Per pair of columns, the number of
+    such rows, the sums and sums of squares of both columns over them and
+    their cross-product are accumulated chunk by chunk with four matrix
+    products, so the correlation matrix needs O(k^2) memory regardless of
+    the number of rows. Values are shifted by a per-column offset first to
+    keep the sums well conditioned.
+
+    A column is numerical if it is numerical in every chunk; a column that
+    turns out to hold text later on is dropped, as when loading the file
+    whole. All values of the first numerical column, which is the one
+    analyzed for anomalies, are kept in memory so that its quartiles are
+    exact. A uniform random sample of rows is kept for plotting.
+
+    Chunks are read in float64. Whether the column values and the sample are
+    then analyzed in float32 is decided once, from the largest magnitude in
+    the whole file, so they are rounded exactly as when it is loaded whole.
 
-def analyze_correlations(df, numerical_cols):
+    Args:
+        file_path (str): The path to the CSV file.
+        chunksize (int): The maximum number of rows read at a time.
+
+    Returns:
+        list: List of numerical column names (empty if there are none).
+        dict: The correlation matrix ('corr'), column means ('mean') and
+        standard deviations ('std'), plus the box plot statistics ('q1',
+        'median', 'q3', 'whislo', 'whishi') and outlier mask ('masks') of the
+        first numerical column only, in the layout of compute_stats.
+        numpy.ndarray: A random sample of at most MAX_SCATTER_POINTS rows
+        of the numerical columns.
+        numpy.ndarray: All values of the first numerical column.
     """
-    Analyzes and finds the most significant correlations in the dataframe.
+    print(f"Streaming data from '{file_path}' in chunks of {chunksize} rows...")
+    candidates = None
+    rng = np.random.default_rng(0)
+    first_col = []
+    sample = None
+    sample_keys = np.empty(0)
+
+    for chunk in load_and_stream(file_path, chunksize):
+        if candidates is None:
+            candidates = chunk.select_dtypes(include=np.number).columns.tolist()
+            if not candidates:
+                return [], None, None, None
+            positions = [chunk.columns.get_loc(col) for col in candidates]
+            k = len(candidates)
+            numeric = np.ones(k, dtype=bool)
+            shift = np.full(k, np.nan)
+            largest = np.zeros(k)
+            # Pairwise observation counts, sums, sums of squares and
+            # cross-products; entry (i, j) covers the rows where both
+            # columns i and j are finite, and the sums are of column i
+            counts = np.zeros((k, k))
+            sums = np.zeros((k, k))
+            squares = np.zeros((k, k))
+            products = np.zeros((k, k))
+            sample = np.empty((0, k))
+
+        numeric &= chunk.columns[positions].isin(chunk.select_dtypes(include=np.number).columns)
+        X = np.full((len(chunk), k), np.nan)
+        live = [col for col, ok in zip(candidates, numeric) if ok]
+        X[:, numeric] = chunk[live].to_numpy(dtype=np.float64)
+        largest = np.fmax(largest, np.fmax.reduce(np.abs(X), axis=0, initial=0.0))
+        if numeric[0]:
+            first_col.append(X[:, 0].copy())
+
+        # A column's offset is fixed the first time it holds a finite value;
+        # it contributed nothing to the sums before then
+        valid = np.isfinite(X)
+        new = np.isnan(shift) & valid.any(axis=0)
+        if new.any():
+            with np.errstate(invalid='ignore'):
+                shift[new] = np.nanmean(np.where(valid[:, new], X[:, new], np.nan), axis=0)
+
+        V = valid.astype(np.float64)
+        Z = np.where(valid, X - shift, 0.0)
+        counts += V.T @ V
+        sums += Z.T @ V
+        squares += (Z * Z).T @ V
+        products += Z.T @ Z
+
+        # Bottom-k sampling on random keys keeps a uniform sample of all rows
+        sample = np.concatenate([sample, X])
+        sample_keys = np.concatenate([sample_keys, rng.random(X.shape[0])])
+        if sample_keys.size > MAX_SCATTER_POINTS:
+            keep = np.argpartition(sample_keys, MAX_SCATTER_POINTS - 1)[:MAX_SCATTER_POINTS]
+            sample = sample[keep]
+            sample_keys = sample_keys[keep]
+
+    if candidates is None or not numeric.any():
+        return [], None, None, None
+
+    numerical_cols = [col for col, ok in zip(candidates, numeric) if ok]
+    pairs = np.ix_(numeric, numeric)
+    counts = counts[pairs]
+    sums = sums[pairs]
+    squares = squares[pairs]
+    products = products[pairs]
+    shift = shift[numeric]
+    # Same rule as _to_float_matrix, applied to the whole file
+    if largest[numeric].max() > FLOAT32_MAX_MAGNITUDE:
+        dtype = np.float64
+    else:
+        dtype = np.float32
+    sample = sample[:, numeric].astype(dtype)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / counts
+        variances = squares / counts - means * means
+        covariances = products / counts - means * means.T
+        # Constant columns have zero spread and yield NaN, as in pandas
+        corr = covariances / np.sqrt(variances * variances.T)
+        mean = shift + np.diag(means)
+        std = np.sqrt(np.diag(variances))
+
+    # The first candidate may have been dropped, in which case the new first
+    # numerical column has to be read again
+    if not numeric[0]:
+        position = positions[int(np.argmax(numeric))]
+        first_col = [
+            chunk.to_numpy(dtype=np.float64)[:, 0]
+            for chunk in load_and_stream(file_path, chunksize, usecols=[position])
+        ]
+    anomaly_values = np.concatenate(first_col, dtype=dtype, casting='same_kind')
+    box, masks = _iqr_outliers(anomaly_values[:, None])
+
+    stats = {
+        'corr': corr,
+        'mean': mean,
+        'std': std,
+        'q1': box[0],
+        'median': box[1],
+        'q3': box[2],
+        'whislo': box[3],
+        'whishi': box[4],
+        'masks': masks
+    }
+    return numerical_cols, stats, sample, anomaly_values
+
+def collect_rows_streaming(file_path, chunksize, rows):
+    """
+    Collects rows of a CSV file by position without loading it whole.
+
+    The file is read again chunk by chunk, and only the requested rows are
+    kept. Reading stops once the last of them has been found.
 
     Args:
-        df (pandas.DataFrame): The input dataframe.
+        file_path (str): The path to the CSV file.
+        chunksize (int): The maximum number of rows read at a time.
+        rows (numpy.ndarray): Positions of the rows to collect.
+
+    Returns:
+        pandas.DataFrame: The requested rows, in the order given.
+    """
+    wanted = np.sort(rows)
+    kept = []
+    empty = None
+    offset = 0
+    for chunk in load_and_stream(file_path, chunksize):
+        if empty is None:
+            empty = chunk.iloc[:0]
+        lo, hi = np.searchsorted(wanted, [offset, offset + len(chunk)])
+        if hi > lo:
+            kept.append(chunk.iloc[wanted[lo:hi] - offset])
+        offset += len(chunk)
+        if hi == wanted.size:
+            break
+
+    if not kept:
+        return empty
+    return pd.concat(kept).iloc[np.searchsorted(wanted, rows)]
+
+def _most_extreme(values, median):
+    """
+    Finds the MAX_REPORTED_ANOMALIES values furthest from the median.
+
+    Args:
+        values (numpy.ndarray): The anomalous values.
+        median (float): The median of the analyzed column.
+
+    Returns:
+        numpy.ndarray: Positions of the most extreme values, most extreme first.
+    """
+    deviation = np.abs(values - median)
+    top = np.argpartition(-deviation, MAX_REPORTED_ANOMALIES - 1)[:MAX_REPORTED_ANOMALIES]
+    return top[np.argsort(-deviation[top], kind='stable')]
+
+def analyze_correlations(corr, numerical_cols):
+    """
+    Finds the most significant correlation in a correlation matrix.
+
+    Args:
+        corr (numpy.ndarray): The correlation matrix of the numerical columns.
         numerical_cols (list): List of numerical column names.
 
     Returns:
         pandas.DataFrame: The correlation matrix.
         tuple: A tuple containing the most correlated pair and their value.
+        tuple: The positions (i, j) of the most correlated pair in the
+        matrix, which stay unambiguous when column names repeat.
     """
     print("Analyzing correlations...")
     if len(numerical_cols) < 2:
-        return None, None
+        return None, None, None
 
-    corr_matrix = df[numerical_cols].corr()
+    corr_matrix = pd.DataFrame(corr, index=numerical_cols, columns=numerical_cols)
 
-    # Unstack the matrix to easily find the max correlation
-    corr_unstacked = corr_matrix.unstack()
+    # Find the most significant correlation (not the diagonal) with a single
+    # argmax; missing values and the diagonal can never be selected
+    off_diagonal = np.where(np.isnan(corr), -np.inf, corr)
+    np.fill_diagonal(off_diagonal, -np.inf)
+    flat = np.argmax(off_diagonal)
+    most_correlated_pair = None
+    most_correlated_idx = None
+    if np.isfinite(off_diagonal.flat[flat]):
+        i, j = divmod(int(flat), off_diagonal.shape[1])
+        most_correlated_pair = (numerical_cols[i], numerical_cols[j], corr[i, j])
+        most_correlated_idx = (i, j)
 
-    # Sort by value
-    sorted_corr = corr_unstacked.sort_values(kind="quicksort", ascending=False)
+    return corr_matrix, most_correlated_pair, most_correlated_idx
 
-    # Find the most significant correlation (not 1.0)
-    most_correlated_pair = None
-    for (col1, col2), value in sorted_corr.items():
-        if col1 != col2:
-            most_correlated_pair = (col1, col2, value)
-            break
+def _plot_heatmap(fig, ax, values, labels, path):
+    """
+    Renders the correlation matrix heatmap to a PNG file.
 
-    return corr_matrix, most_correlated_pair
+    Args:
+        fig (matplotlib.figure.Figure): The shared figure, cleared afterwards.
+        ax (matplotlib.axes.Axes): The axes of the shared figure.
+        values (numpy.ndarray): The correlation matrix.
+        labels (list): The column names, in matrix order.
+        path (pathlib.Path): Output file path.
+    """
+    k = len(labels)
+    fig.set_size_inches(10, 8)
+    im = ax.imshow(values, cmap='coolwarm', vmin=-1, vmax=1, interpolation='nearest')
+    cbar = fig.colorbar(im, ax=ax)
+    ax.set_xticks(range(k), labels=labels, rotation=45, ha='right')
+    ax.set_yticks(range(k), labels=labels)
+    # Per-cell annotations are only legible (and cheap) on small matrices
+    if k <= 20:
+        for (i, j), value in np.ndenumerate(values):
+            color = 'white' if abs(value) > 0.5 else 'black'
+            ax.text(j, i, f"{value:.2f}", ha='center', va='center', color=color)
+    ax.set_title('Correlation Matrix')
+    fig.tight_layout()
+    fig.savefig(path, bbox_inches=None, **PNG_SAVE_OPTIONS)
+    cbar.remove()
+    ax.clear()
+    # imshow pins a square aspect ratio that clear() leaves in place
+    ax.set_aspect('auto')
+
+def _plot_scatter(fig, ax, x, y, xlabel, ylabel, path, sampled=False):
+    """
+    Renders a scatter plot of two variables to a PNG file.
 
-def detect_anomalies(df, col):
+    Args:
+        fig (matplotlib.figure.Figure): The shared figure, cleared afterwards.
+        ax (matplotlib.axes.Axes): The axes of the shared figure.
+        x (numpy.ndarray): Values for the horizontal axis.
+        y (numpy.ndarray): Values for the vertical axis.
+        xlabel (str): Name of the horizontal variable.
+        ylabel (str): Name of the vertical variable.
+        path (pathlib.Path): Output file path.
+        sampled (bool): Whether the points are a sample of a larger dataset,
+            in which case smaller translucent markers are used.
     """
-    Detects anomalies in a specific column using the IQR method.
+    fig.set_size_inches(8, 6)
+    if sampled:
+        ax.scatter(x, y, s=3, alpha=0.4, rasterized=True)
+    else:
+        ax.scatter(x, y, s=4, rasterized=True)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(f'Scatter Plot: {xlabel} vs {ylabel}')
+    fig.tight_layout()
+    fig.savefig(path, **PNG_SAVE_OPTIONS)
+    ax.clear()
+
+def _box_stats(stats, col_idx, values):
+    """
+    Collects the precomputed box plot statistics of one column.
 
     Args:
-        df (pandas.DataFrame): The input dataframe.
-        col (str): The column to analyze for anomalies.
+        stats (dict): Summary statistics, as returned by compute_stats.
+        col_idx (int): The index of the column in the statistics.
+        values (numpy.ndarray): All values of the column.
 
     Returns:
-        pandas.Series: A series of anomalous data points.
+        dict: Statistics in the format expected by ``Axes.bxp``.
     """
-    print(f"Detecting anomalies in column '{col}'...")
-    Q1 = df[col].quantile(0.25)
-    Q3 = df[col].quantile(0.75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
+    return {
+        'med': stats['median'][col_idx],
+        'q1': stats['q1'][col_idx],
+        'q3': stats['q3'][col_idx],
+        'whislo': stats['whislo'][col_idx],
+        'whishi': stats['whishi'][col_idx],
+        'fliers': values[stats['masks'][col_idx]]
+    }
+
+def _plot_box(fig, ax, box_stats, label, path):
+    """
+    Renders a box plot of one variable to a PNG file.
 
-    anomalies = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-    return anomalies
+    The plot is drawn from precomputed statistics, so the data itself is not
+    scanned again.
 
-def create_visualizations(df, corr_matrix, most_correlated_pair, anomaly_col, output_dir):
+    Args:
+        fig (matplotlib.figure.Figure): The shared figure, cleared afterwards.
+        ax (matplotlib.axes.Axes): The axes of the shared figure.
+        box_stats (dict): Box plot statistics, as returned by _box_stats.
+        label (str): Name of the variable.
+        path (pathlib.Path): Output file path.
+    """
+    fig.set_size_inches(8, 6)
+    ax.bxp([box_stats], showfliers=True)
+    ax.set_xticks([])
+    ax.set_ylabel(label)
+    ax.set_title(f'Anomaly Detection in {label}')
+    fig.tight_layout()
+    fig.savefig(path, **PNG_SAVE_OPTIONS)
+    ax.clear()
+
+def create_visualizations(num, corr_matrix, most_correlated_pair, most_correlated_idx, anomaly_col, box_stats, output_dir, sampled=False):
     """
     Generates and saves data visualizations.
 
     Args:
-        df (pandas.DataFrame): The input dataframe.
+        num (numpy.ndarray): 2D array of numerical values, one column per
+            variable, as analyzed (or a random sample of its rows).
         corr_matrix (pandas.DataFrame): The correlation matrix.
         most_correlated_pair (tuple): The most correlated pair of variables.
+        most_correlated_idx (tuple): The column positions of that pair in num.
         anomaly_col (str): The column selected for anomaly detection visualization.
-        output_dir (str): The directory to save visualizations.
+        box_stats (dict): Precomputed box plot statistics of the anomaly column.
+        output_dir (pathlib.Path): The directory to save visualizations.
+        sampled (bool): Whether num is already a random sample of the rows.
 
     Returns:
         dict: A dictionary of paths to the saved visualization files.
@@ -102,37 +570,43 @@ def create_visualizations(df, corr_matrix, most_correlated_pair, anomaly_col, ou
     print("Creating visualizations...")
     paths = {}
 
+    # A single figure is reused for every plot; only its size and axes
+    # contents change between them
+    fig, ax = plt.subplots(figsize=(10, 8))
+
     # 1. Correlation Heatmap
     if corr_matrix is not None:
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', fmt=".2f")
-        plt.title('Correlation Matrix')
-        path = os.path.join(output_dir, 'correlation_heatmap.png')
-        plt.savefig(path)
-        plt.close()
+        path = output_dir / 'correlation_heatmap.png'
+        _plot_heatmap(fig, ax, corr_matrix.to_numpy(), corr_matrix.columns.tolist(), path)
         paths['heatmap'] = path
 
     # 2. Scatter Plot for the most correlated pair
     if most_correlated_pair:
         col1, col2, _ = most_correlated_pair
-        plt.figure(figsize=(8, 6))
-        sns.scatterplot(data=df, x=col1, y=col2)
-        plt.title(f'Scatter Plot: {col1} vs {col2}')
-        path = os.path.join(output_dir, 'correlation_scatter_plot.png')
-        plt.savefig(path)
-        plt.close()
+        # Index the analyzed matrix by position instead of going back to
+        # the DataFrame for each column
+        i, j = most_correlated_idx
+        x = num[:, i]
+        y = num[:, j]
+        # Drawing every marker of a large dataset is slow and unreadable;
+        # a fixed-seed random sample keeps the shape of the relationship
+        n = len(x)
+        if n > MAX_SCATTER_POINTS:
+            idx = np.random.default_rng(0).choice(n, MAX_SCATTER_POINTS, replace=False)
+            x = x[idx]
+            y = y[idx]
+            sampled = True
+        path = output_dir / 'correlation_scatter_plot.png'
+        _plot_scatter(fig, ax, x, y, col1, col2, path, sampled)
         paths['scatter'] = path
 
     # 3. Box Plot for anomaly detection
     if anomaly_col:
-        plt.figure(figsize=(8, 6))
-        sns.boxplot(data=df, y=anomaly_col)
-        plt.title(f'Anomaly Detection in {anomaly_col}')
-        path = os.path.join(output_dir, 'anomaly_boxplot.png')
-        plt.savefig(path)
-        plt.close()
+        path = output_dir / 'anomaly_boxplot.png'
+        _plot_box(fig, ax, box_stats, anomaly_col, path)
         paths['boxplot'] = path
 
+    plt.close(fig)
     return paths
 
 def generate_report(findings, viz_paths, output_dir):
@@ -142,46 +616,52 @@ def generate_report(findings, viz_paths, output_dir):
     Args:
         findings (dict): A dictionary containing analysis results.
         viz_paths (dict): A dictionary of paths to visualization files.
-        output_dir (str): The directory to save the report.
+        output_dir (pathlib.Path): The directory to save the report.
     """
     print("Generating report...")
-    report_path = os.path.join(output_dir, 'report.md')
-
-    with open(report_path, 'w') as f:
-        f.write("# Automated Data Analysis Report\n\n")
-        f.write("## 1. Introduction\n")
-        f.write("This report provides an automated analysis of the provided dataset. It highlights key correlations and identifies potential anomalies.\n\n")
-
-        # Correlation Section
-        f.write("## 2. Correlation Analysis\n")
-        if findings.get('most_correlated_pair'):
-            col1, col2, val = findings['most_correlated_pair']
-            f.write(f"The analysis identified a strong relationship between variables. The most significant correlation is between **{col1}** and **{col2}** with a correlation coefficient of **{val:.2f}**.\n\n")
-            if 'heatmap' in viz_paths:
-                f.write("### Correlation Matrix Heatmap\n")
-                f.write(f"![Correlation Heatmap](correlation_heatmap.png)\n\n")
-            if 'scatter' in viz_paths:
-                f.write(f"### Scatter Plot: {col1} vs {col2}\n")
-                f.write(f"![Scatter Plot](correlation_scatter_plot.png)\n\n")
-        else:
-            f.write("No significant correlations were found among the numerical variables.\n\n")
-
-        # Anomaly Section
-        f.write("## 3. Anomaly Detection\n")
-        if findings.get('anomalies') is not None and not findings['anomalies'].empty:
-            anomaly_col = findings['anomaly_col']
-            f.write(f"Anomaly detection was performed on the **'{anomaly_col}'** column. The following outliers were identified:\n\n")
-            f.write(findings['anomalies'].to_markdown(index=False))
-            f.write("\n\n")
-            if 'boxplot' in viz_paths:
-                f.write(f"### Box Plot for {anomaly_col}\n")
-                f.write(f"This box plot visualizes the distribution and highlights the outliers.\n\n")
-                f.write(f"![Anomaly Boxplot](anomaly_boxplot.png)\n\n")
-        else:
-            f.write("No significant anomalies were detected in the analyzed column.\n\n")
-
-        f.write("## 4. Conclusion\n")
-        f.write("This automated report is intended to provide a high-level overview of the data. Further investigation is recommended to understand the context behind these findings.\n")
+    report_path = output_dir / 'report.md'
+
+    parts = []
+    parts.append("# Automated Data Analysis Report\n\n")
+    parts.append("## 1. Introduction\n")
+    parts.append("This report provides an automated analysis of the provided dataset. It highlights key correlations and identifies potential anomalies.\n\n")
+
+    # Correlation Section
+    parts.append("## 2. Correlation Analysis\n")
+    if findings.get('most_correlated_pair'):
+        col1, col2, val = findings['most_correlated_pair']
+        parts.append(f"The analysis identified a strong relationship between variables. The most significant correlation is between **{col1}** and **{col2}** with a correlation coefficient of **{val:.2f}**.\n\n")
+        if 'heatmap' in viz_paths:
+            parts.append("### Correlation Matrix Heatmap\n")
+            parts.append(f"![Correlation Heatmap](correlation_heatmap.png)\n\n")
+        if 'scatter' in viz_paths:
+            parts.append(f"### Scatter Plot: {col1} vs {col2}\n")
+            parts.append(f"![Scatter Plot](correlation_scatter_plot.png)\n\n")
+    else:
+        parts.append("No significant correlations were found among the numerical variables.\n\n")
+
+    # Anomaly Section
+    parts.append("## 3. Anomaly Detection\n")
+    if findings.get('anomalies') is not None and not findings['anomalies'].empty:
+        anomaly_col = findings['anomaly_col']
+        parts.append(f"Anomaly detection was performed on the **'{anomaly_col}'** column. The following outliers were identified:\n\n")
+        parts.append(findings['anomalies'].to_markdown(index=False))
+        parts.append("\n\n")
+        total_count = findings.get('anomaly_count', len(findings['anomalies']))
+        if total_count > len(findings['anomalies']):
+            parts.append(f"(showing top {len(findings['anomalies'])} of {total_count} anomalies)\n\n")
+        if 'boxplot' in viz_paths:
+            parts.append(f"### Box Plot for {anomaly_col}\n")
+            parts.append(f"This box plot visualizes the distribution and highlights the outliers.\n\n")
+            parts.append(f"![Anomaly Boxplot](anomaly_boxplot.png)\n\n")
+    else:
+        parts.append("No significant anomalies were detected in the analyzed column.\n\n")
+
+    parts.append("## 4. Conclusion\n")
+    parts.append("This automated report is intended to provide a high-level overview of the data. Further investigation is recommended to understand the context behind these findings.\n")
+
+    with open(report_path, 'w', buffering=1 << 20) as f:
+        f.write("".join(parts))
 
     print(f"Report successfully generated at '{report_path}'")
 
@@ -191,44 +671,104 @@ def main():
     """
     parser = argparse.ArgumentParser(description="Data Storytelling Automator")
     parser.add_argument("file_path", type=str, help="Path to the input CSV file.")
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help=(
+            "Stream the CSV file in chunks of this many rows instead of loading it "
+            "whole. All values of the column analyzed for anomalies (the first "
+            "numerical one) must still fit in memory."
+        )
+    )
     args = parser.parse_args()
 
     try:
         # Define output directory
-        output_dir = 'reports'
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        # 1. Load Data
-        df = load_data(args.file_path)
-
-        # Identify numerical columns for analysis
-        numerical_cols = df.select_dtypes(include=np.number).columns.tolist()
-
-        if not numerical_cols:
-            print("Error: No numerical columns found for analysis.")
-            return
-
-        # 2. Analyze Data
-        corr_matrix, most_correlated_pair = analyze_correlations(df, numerical_cols)
-
-        # For simplicity, we'll detect anomalies in the first numerical column
-        anomaly_col = numerical_cols[0]
-        anomalies = detect_anomalies(df, anomaly_col)
+        output_dir = pathlib.Path('reports')
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        if args.chunksize:
+            # 1-2. Stream the data through the analysis without loading it
+            # whole; num only holds a random sample of the rows, for plotting
+            numerical_cols, stats, num, anomaly_values = compute_stats_streaming(
+                args.file_path, args.chunksize
+            )
+
+            if not numerical_cols:
+                print("Error: No numerical columns found for analysis.")
+                return
+
+            corr_matrix, most_correlated_pair, most_correlated_idx = analyze_correlations(
+                stats['corr'], numerical_cols
+            )
+
+            # For simplicity, we'll detect anomalies in the first numerical
+            # column; its outlier mask is in file row order, so the rows to
+            # report are picked as in the in-memory path and then read again
+            anomaly_col = numerical_cols[0]
+            print(f"Detecting anomalies in column '{anomaly_col}'...")
+            rows = np.flatnonzero(stats['masks'][0])
+            anomaly_count = rows.size
+            if anomaly_count > MAX_REPORTED_ANOMALIES:
+                rows = rows[_most_extreme(anomaly_values[rows], stats['median'][0])]
+            anomalies = collect_rows_streaming(args.file_path, args.chunksize, rows)
+            # The sample only leaves rows out once the file outgrows it
+            sampled = anomaly_values.size > MAX_SCATTER_POINTS
+        else:
+            # 1. Load Data
+            df = load_data(args.file_path)
+
+            # Identify numerical columns for analysis
+            num_df = df.select_dtypes(include=np.number)
+            numerical_cols = num_df.columns.tolist()
+
+            if not numerical_cols:
+                print("Error: No numerical columns found for analysis.")
+                return
+
+            # Materialize the numerical columns once, straight from the selected
+            # blocks; column-major suits the per-column reductions below and is
+            # what pandas produces, so no further copy is made
+            num = _to_float_matrix(num_df)
+
+            # 2. Analyze Data
+            stats = compute_stats(num)
+            corr_matrix, most_correlated_pair, most_correlated_idx = analyze_correlations(
+                stats['corr'], numerical_cols
+            )
+
+            # For simplicity, we'll detect anomalies in the first numerical column
+            anomaly_col = numerical_cols[0]
+            print(f"Detecting anomalies in column '{anomaly_col}'...")
+            rows = np.flatnonzero(stats['masks'][0])
+            anomaly_count = rows.size
+
+            # Only the most extreme outliers (furthest from the median) are
+            # tabulated, so the report stays small however many there are
+            anomaly_values = num[:, 0]
+            if anomaly_count > MAX_REPORTED_ANOMALIES:
+                rows = rows[_most_extreme(anomaly_values[rows], stats['median'][0])]
+            anomalies = df.iloc[rows]
+            sampled = False
 
         findings = {
             'most_correlated_pair': most_correlated_pair,
             'anomalies': anomalies,
+            'anomaly_count': anomaly_count,
             'anomaly_col': anomaly_col
         }
 
         # 3. Create Visualizations
         viz_paths = create_visualizations(
-            df,
+            num,
             corr_matrix,
             most_correlated_pair,
+            most_correlated_idx,
             anomaly_col,
-            output_dir
+            _box_stats(stats, 0, anomaly_values),
+            output_dir,
+            sampled
         )
 
         # 4. Generate Report